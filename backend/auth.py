@@ -1,40 +1,189 @@
 """Authentication utilities for JWT tokens and password hashing."""
 
+import asyncio
+import base64
+import binascii
+import hmac
+import json
+import math
+import os
+import re
+import secrets
+import time
 import bcrypt
-import jwt
-from datetime import datetime, timedelta
+from argon2 import PasswordHasher, Type
+from argon2.exceptions import InvalidHashError, VerificationError
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from typing import Optional, Dict, Any
 
-from .config import JWT_SECRET, JWT_ALGORITHM, JWT_EXPIRATION_HOURS
+from .config import (
+    JWT_SECRET,
+    JWT_ALGORITHM,
+    JWT_EXPIRATION_HOURS,
+    ARGON2_TIME_COST,
+    ARGON2_MEMORY_COST,
+    ARGON2_PARALLELISM,
+)
+
+
+# argon2-cffi and bcrypt both release the GIL while hashing, so a pool sized
+# to the core count lets concurrent logins run in parallel without stalling
+# the event loop.
+_HASH_WORKERS = os.cpu_count() or 1
+_hash_executor = ThreadPoolExecutor(max_workers=_HASH_WORKERS, thread_name_prefix="password-hash")
+_hash_semaphore = asyncio.Semaphore(_HASH_WORKERS)
+
+_password_hasher = PasswordHasher(
+    time_cost=ARGON2_TIME_COST,
+    memory_cost=ARGON2_MEMORY_COST,
+    parallelism=ARGON2_PARALLELISM,
+    type=Type.ID
+)
+
+# Hash checked when a login names an unknown email, so that case takes as
+# long as a wrong password (see verify_dummy_password_async)
+_dummy_password_hash: Optional[str] = None
+
+# Encoded once; every request verifies a token against it
+_JWT_SECRET_BYTES = JWT_SECRET.encode('utf-8')
+_JWT_EXPIRATION_SECONDS = int(timedelta(hours=JWT_EXPIRATION_HOURS).total_seconds())
+
+
+def _is_bcrypt_hash(password_hash: str) -> bool:
+    """Check whether a stored hash predates the move to Argon2id."""
+    return password_hash.startswith("$2")
 
 
 def hash_password(password: str) -> str:
     """
-    Hash a password using bcrypt.
+    Hash a password using Argon2id.
 
     Args:
         password: Plain text password
 
     Returns:
-        Bcrypt-hashed password string
+        Argon2id-hashed password string ("$argon2id$...")
     """
-    salt = bcrypt.gensalt(rounds=12)
-    hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-    return hashed.decode('utf-8')
+    return _password_hasher.hash(password)
 
 
 def verify_password(password: str, password_hash: str) -> bool:
     """
     Verify a password against its hash.
 
+    Legacy bcrypt hashes are still accepted so existing users can log in and
+    be migrated (see password_needs_rehash).
+
+    Args:
+        password: Plain text password
+        password_hash: Argon2id or legacy bcrypt password hash
+
+    Returns:
+        True if password matches, False otherwise
+    """
+    if _is_bcrypt_hash(password_hash):
+        return bcrypt.checkpw(password.encode('utf-8'), password_hash.encode('utf-8'))
+
+    try:
+        return _password_hasher.verify(password_hash, password)
+    except (VerificationError, InvalidHashError):
+        # VerifyMismatchError (wrong password) is a VerificationError
+        return False
+
+
+def password_needs_rehash(password_hash: str) -> bool:
+    """
+    Check whether a stored hash should be replaced after a successful login.
+
+    Args:
+        password_hash: Argon2id or legacy bcrypt password hash
+
+    Returns:
+        True for bcrypt hashes and Argon2 hashes with outdated parameters
+    """
+    if _is_bcrypt_hash(password_hash):
+        return True
+    try:
+        return _password_hasher.check_needs_rehash(password_hash)
+    except InvalidHashError:
+        return False
+
+
+async def _run_hash_job(func, *args):
+    """Run a blocking hash function on the password hashing thread pool."""
+    async with _hash_semaphore:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_hash_executor, func, *args)
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password without blocking the event loop.
+
+    Args:
+        password: Plain text password
+
+    Returns:
+        Argon2id-hashed password string
+    """
+    return await _run_hash_job(hash_password, password)
+
+
+async def verify_password_async(password: str, password_hash: str) -> bool:
+    """
+    Verify a password against its hash without blocking the event loop.
+
     Args:
         password: Plain text password
-        password_hash: Bcrypt-hashed password
+        password_hash: Argon2id or legacy bcrypt password hash
 
     Returns:
         True if password matches, False otherwise
     """
-    return bcrypt.checkpw(password.encode('utf-8'), password_hash.encode('utf-8'))
+    return await _run_hash_job(verify_password, password, password_hash)
+
+
+def _b64url_encode(data: bytes) -> str:
+    """Encode bytes as unpadded base64url, as JWT segments require."""
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+
+# The header never changes, so it is serialized once
+_JWT_HEADER_B64 = _b64url_encode(
+    json.dumps({"alg": JWT_ALGORITHM, "typ": "JWT"}, separators=(',', ':')).encode('utf-8')
+)
+
+
+def _verify_against_dummy_hash(password: str) -> bool:
+    """Run a full verification against the dummy hash, creating it if needed."""
+    global _dummy_password_hash
+    if _dummy_password_hash is None:
+        _dummy_password_hash = hash_password(secrets.token_urlsafe(16))
+    verify_password(password, _dummy_password_hash)
+    return False
+
+
+async def verify_dummy_password_async(password: str) -> bool:
+    """
+    Spend a real password verification on a login for an unknown email.
+
+    This keeps unknown emails from answering faster than wrong passwords
+    (which would let callers enumerate accounts) and makes those attempts
+    go through the same bounded hash pool.
+
+    Args:
+        password: Plain text password from the login attempt
+
+    Returns:
+        Always False
+    """
+    return await _run_hash_job(_verify_against_dummy_hash, password)
+
+
+async def warm_up_password_hashing():
+    """Create the dummy hash and start the hash pool threads ahead of the first login."""
+    await verify_dummy_password_async("")
 
 
 def create_token(user_id: str, email: str, is_admin: bool = False) -> str:
@@ -49,33 +198,91 @@ def create_token(user_id: str, email: str, is_admin: bool = False) -> str:
     Returns:
         JWT token string
     """
-    expiration = datetime.utcnow() + timedelta(hours=JWT_EXPIRATION_HOURS)
+    now = int(time.time())
 
     payload = {
         "sub": user_id,
         "email": email,
         "is_admin": is_admin,
-        "exp": expiration,
-        "iat": datetime.utcnow()
+        "exp": now + _JWT_EXPIRATION_SECONDS,
+        "iat": now
     }
 
-    return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
+    payload_b64 = _b64url_encode(json.dumps(payload, separators=(',', ':')).encode('utf-8'))
+    signing_input = f"{_JWT_HEADER_B64}.{payload_b64}"
+    signature = hmac.digest(_JWT_SECRET_BYTES, signing_input.encode('ascii'), 'sha256')
+
+    return f"{signing_input}.{_b64url_encode(signature)}"
+
+
+# urlsafe_b64decode silently drops characters outside the alphabet, so a
+# token with junk appended would otherwise still verify
+_B64URL_SEGMENT = re.compile(r'[A-Za-z0-9_-]*')
+
+
+def _b64url_decode(segment: str) -> bytes:
+    """Decode a base64url segment, restoring the stripped padding.
+
+    Raises:
+        ValueError: If the segment contains characters outside the base64url
+            alphabet
+    """
+    if not _B64URL_SEGMENT.fullmatch(segment):
+        raise ValueError("Invalid base64url segment")
+    return base64.urlsafe_b64decode(segment + '=' * (-len(segment) % 4))
+
+
+def _is_timestamp(value: Any) -> bool:
+    """Check that a JWT time claim is a finite number (bool excluded)."""
+    return (
+        isinstance(value, (int, float))
+        and not isinstance(value, bool)
+        and math.isfinite(value)
+    )
 
 
 def verify_token(token: str) -> Optional[Dict[str, Any]]:
     """
     Verify and decode a JWT token.
 
+    Only HS256 tokens are accepted. The signature is checked with a single
+    OpenSSL-backed HMAC call, since this runs on every authenticated request.
+
     Args:
         token: JWT token string
 
     Returns:
-        Decoded payload dict or None if invalid/expired
+        Decoded payload dict or None if invalid, expired or missing a
+        numeric exp
     """
     try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
-        return payload
-    except jwt.ExpiredSignatureError:
+        header_b64, payload_b64, signature_b64 = token.split('.')
+        header = json.loads(_b64url_decode(header_b64))
+        if not isinstance(header, dict) or header.get("alg") != JWT_ALGORITHM:
+            return None
+
+        expected = hmac.digest(
+            _JWT_SECRET_BYTES,
+            f"{header_b64}.{payload_b64}".encode('ascii'),
+            'sha256'
+        )
+        if not hmac.compare_digest(expected, _b64url_decode(signature_b64)):
+            return None
+
+        payload = json.loads(_b64url_decode(payload_b64))
+    except (ValueError, binascii.Error, UnicodeError):
         return None
-    except jwt.InvalidTokenError:
+
+    if not isinstance(payload, dict):
         return None
+
+    # Every token we issue has a numeric exp; callers rely on it to bound
+    # how long a verified token may be cached
+    exp = payload.get("exp")
+    if not _is_timestamp(exp) or exp <= time.time():
+        return None
+    nbf = payload.get("nbf")
+    if nbf is not None and (not _is_timestamp(nbf) or nbf > time.time()):
+        return None
+
+    return payload
@@ -5,6 +5,17 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Number of uvicorn worker processes when running `python -m backend.main`.
+# Keep this at 1 unless conversations move to storage with cross-process
+# locking: the JSON files are read-modify-written without locks, so two
+# workers handling the same conversation can lose messages. Each worker also
+# has its own caches and connection pools (see _USER_CACHE_TTL in users.py
+# for how long a deleted user stays valid on other workers).
+WORKERS = int(os.getenv("WORKERS", "1"))
+
+# Log level for the backend.* loggers (e.g. DEBUG for per-message voice logs)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+
 # OpenRouter API key
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
 
@@ -13,6 +24,13 @@ JWT_SECRET = os.getenv("JWT_SECRET", "change-this-secret-in-production")
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRATION_HOURS = 24
 
+# Argon2id parameters for new password hashes (memory cost in KiB). Legacy
+# bcrypt hashes and hashes with older parameters are upgraded transparently
+# the next time the user logs in.
+ARGON2_TIME_COST = int(os.getenv("ARGON2_TIME_COST", "2"))
+ARGON2_MEMORY_COST = int(os.getenv("ARGON2_MEMORY_COST", "65536"))
+ARGON2_PARALLELISM = int(os.getenv("ARGON2_PARALLELISM", "4"))
+
 # Admin user credentials (for initial setup)
 ADMIN_EMAIL = os.getenv("ADMIN_EMAIL", "admin@example.com")
 ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "admin123")
@@ -24,6 +42,10 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 TTS_VOICE = "alloy"  # Options: alloy, echo, fable, onyx, nova, shimmer
 TTS_MODEL = "tts-1"  # Options: tts-1, tts-1-hd
 
+# On-disk cache of synthesized speech, evicted least-recently-used first
+TTS_CACHE_DIR = "data/tts_cache"
+TTS_CACHE_MAX_BYTES = 2 << 30  # 2 GiB
+
 # Council members - list of OpenRouter model identifiers
 COUNCIL_MODELS = [
     "openai/gpt-5.1",
@@ -1,7 +1,12 @@
 """3-stage LLM Council orchestration."""
 
-from typing import List, Dict, Any, Tuple
-from .openrouter import query_models_parallel, query_model
+from typing import List, Dict, Any, Tuple, AsyncIterator
+from .openrouter import (
+    query_models_parallel,
+    query_models_as_completed,
+    query_model,
+    query_model_stream
+)
 from .config import COUNCIL_MODELS, CHAIRMAN_MODEL
 
 
@@ -32,29 +37,50 @@ async def stage1_collect_responses(user_query: str) -> List[Dict[str, Any]]:
     return stage1_results
 
 
-async def stage2_collect_rankings(
-    user_query: str,
-    stage1_results: List[Dict[str, Any]]
-) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+async def stage1_stream_responses(user_query: str) -> AsyncIterator[Dict[str, Any]]:
     """
-    Stage 2: Each model ranks the anonymized responses.
+    Stage 1, streaming variant: yield each council response as soon as it arrives.
 
     Args:
-        user_query: The original user query
-        stage1_results: Results from Stage 1
+        user_query: The user's question
+
+    Yields:
+        Dicts with 'model' and 'response' keys, in completion order
+    """
+    messages = [{"role": "user", "content": user_query}]
+
+    async for model, response in query_models_as_completed(COUNCIL_MODELS, messages):
+        if response is not None:  # Only include successful responses
+            yield {
+                "model": model,
+                "response": response.get('content', '')
+            }
+
+
+def create_label_to_model(stage1_results: List[Dict[str, Any]]) -> Dict[str, str]:
+    """
+    Map anonymized labels ("Response A", "Response B", ...) to model names.
+
+    Args:
+        stage1_results: Results from Stage 1, in the order they are labelled
 
     Returns:
-        Tuple of (rankings list, label_to_model mapping)
+        Dict mapping each label to its model identifier
     """
+    return {
+        f"Response {chr(65 + i)}": result['model']
+        for i, result in enumerate(stage1_results)
+    }
+
+
+def _build_ranking_messages(
+    user_query: str,
+    stage1_results: List[Dict[str, Any]]
+) -> List[Dict[str, str]]:
+    """Build the Stage 2 prompt asking a model to rank the anonymized responses."""
     # Create anonymized labels for responses (Response A, Response B, etc.)
     labels = [chr(65 + i) for i in range(len(stage1_results))]  # A, B, C, ...
 
-    # Create mapping from label to model name
-    label_to_model = {
-        f"Response {label}": result['model']
-        for label, result in zip(labels, stage1_results)
-    }
-
     # Build the ranking prompt
     responses_text = "\n\n".join([
         f"Response {label}:\n{result['response']}"
@@ -92,7 +118,37 @@ FINAL RANKING:
 
 Now provide your evaluation and ranking:"""
 
-    messages = [{"role": "user", "content": ranking_prompt}]
+    return [{"role": "user", "content": ranking_prompt}]
+
+
+def _format_ranking(model: str, response: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn a model's Stage 2 reply into a ranking result dict."""
+    full_text = response.get('content', '')
+    return {
+        "model": model,
+        "ranking": full_text,
+        "parsed_ranking": parse_ranking_from_text(full_text)
+    }
+
+
+async def stage2_collect_rankings(
+    user_query: str,
+    stage1_results: List[Dict[str, Any]]
+) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+    """
+    Stage 2: Each model ranks the anonymized responses.
+
+    Args:
+        user_query: The original user query
+        stage1_results: Results from Stage 1
+
+    Returns:
+        Tuple of (rankings list, label_to_model mapping)
+    """
+    # Create mapping from label to model name
+    label_to_model = create_label_to_model(stage1_results)
+
+    messages = _build_ranking_messages(user_query, stage1_results)
 
     # Get rankings from all council models in parallel
     responses = await query_models_parallel(COUNCIL_MODELS, messages)
@@ -101,24 +157,46 @@ Now provide your evaluation and ranking:"""
     stage2_results = []
     for model, response in responses.items():
         if response is not None:
-            full_text = response.get('content', '')
-            parsed = parse_ranking_from_text(full_text)
-            stage2_results.append({
-                "model": model,
-                "ranking": full_text,
-                "parsed_ranking": parsed
-            })
+            stage2_results.append(_format_ranking(model, response))
 
     return stage2_results, label_to_model
 
 
-async def stage3_synthesize_final(
+async def stage2_stream_rankings(
+    user_query: str,
+    stage1_results: List[Dict[str, Any]]
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stage 2, streaming variant: yield each model's ranking as soon as it arrives.
+
+    Use create_label_to_model(stage1_results) for the matching label mapping.
+
+    Args:
+        user_query: The original user query
+        stage1_results: Results from Stage 1
+
+    Yields:
+        Ranking dicts with 'model', 'ranking' and 'parsed_ranking' keys,
+        in completion order
+    """
+    messages = _build_ranking_messages(user_query, stage1_results)
+
+    async for model, response in query_models_as_completed(COUNCIL_MODELS, messages):
+        if response is not None:
+            yield _format_ranking(model, response)
+
+
+# Stage 3 response used when the chairman model fails
+STAGE3_ERROR_RESPONSE = "Error: Unable to generate final synthesis."
+
+
+def _build_chairman_messages(
     user_query: str,
     stage1_results: List[Dict[str, Any]],
     stage2_results: List[Dict[str, Any]]
-) -> Dict[str, Any]:
+) -> List[Dict[str, str]]:
     """
-    Stage 3: Chairman synthesizes final response.
+    Build the chairman prompt for Stage 3.
 
     Args:
         user_query: The original user query
@@ -126,7 +204,7 @@ async def stage3_synthesize_final(
         stage2_results: Rankings from Stage 2
 
     Returns:
-        Dict with 'model' and 'response' keys
+        Messages to send to the chairman model
     """
     # Build comprehensive context for chairman
     stage1_text = "\n\n".join([
@@ -156,7 +234,26 @@ Your task as Chairman is to synthesize all of this information into a single, co
 
 Provide a clear, well-reasoned final answer that represents the council's collective wisdom:"""
 
-    messages = [{"role": "user", "content": chairman_prompt}]
+    return [{"role": "user", "content": chairman_prompt}]
+
+
+async def stage3_synthesize_final(
+    user_query: str,
+    stage1_results: List[Dict[str, Any]],
+    stage2_results: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Stage 3: Chairman synthesizes final response.
+
+    Args:
+        user_query: The original user query
+        stage1_results: Individual model responses from Stage 1
+        stage2_results: Rankings from Stage 2
+
+    Returns:
+        Dict with 'model' and 'response' keys
+    """
+    messages = _build_chairman_messages(user_query, stage1_results, stage2_results)
 
     # Query the chairman model
     response = await query_model(CHAIRMAN_MODEL, messages)
@@ -165,7 +262,7 @@ Provide a clear, well-reasoned final answer that represents the council's collec
         # Fallback if chairman fails
         return {
             "model": CHAIRMAN_MODEL,
-            "response": "Error: Unable to generate final synthesis."
+            "response": STAGE3_ERROR_RESPONSE
         }
 
     return {
@@ -174,6 +271,31 @@ Provide a clear, well-reasoned final answer that represents the council's collec
     }
 
 
+async def stage3_stream_final(
+    user_query: str,
+    stage1_results: List[Dict[str, Any]],
+    stage2_results: List[Dict[str, Any]]
+) -> AsyncIterator[str]:
+    """
+    Stage 3, streaming: yield the chairman's synthesis as it is generated.
+
+    Raises if the chairman request fails, including part-way through;
+    callers should then fall back to STAGE3_ERROR_RESPONSE.
+
+    Args:
+        user_query: The original user query
+        stage1_results: Individual model responses from Stage 1
+        stage2_results: Rankings from Stage 2
+
+    Yields:
+        Chunks of the final response text
+    """
+    messages = _build_chairman_messages(user_query, stage1_results, stage2_results)
+
+    async for delta in query_model_stream(CHAIRMAN_MODEL, messages):
+        yield delta
+
+
 def parse_ranking_from_text(ranking_text: str) -> List[str]:
     """
     Parse the FINAL RANKING section from the model's response.
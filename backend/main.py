@@ -4,18 +4,70 @@ from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, Depe
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, EmailStr
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 import uuid
-import json
 import asyncio
+import logging
+import logging.handlers
+import queue
+import orjson
 
 from . import storage
 from . import users
-from .auth import hash_password, verify_password, create_token
-from .middleware import get_current_user, get_current_admin
-from .council import run_full_council, generate_conversation_title, stage1_collect_responses, stage2_collect_rankings, stage3_synthesize_final, calculate_aggregate_rankings
+from . import tts
+from . import openrouter
+from .openai_realtime import realtime_client_pool
+from .auth import hash_password_async, verify_password_async, verify_dummy_password_async, warm_up_password_hashing, password_needs_rehash, create_token
+from .middleware import get_current_user, get_current_admin, authenticate_token
+from .council import run_full_council, generate_conversation_title, stage1_stream_responses, stage2_stream_rankings, create_label_to_model, stage3_synthesize_final, calculate_aggregate_rankings
 from .voice import VoiceChatSession
-from .config import OPENAI_API_KEY, TTS_VOICE, ADMIN_EMAIL, ADMIN_PASSWORD
+from .config import OPENAI_API_KEY, TTS_VOICE, ADMIN_EMAIL, ADMIN_PASSWORD, WORKERS, LOG_LEVEL
+
+
+# Backend loggers hand records to a queue drained by a listener thread, set
+# up in the startup hook; see _start_logging()
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _start_logging():
+    """
+    Route "backend" loggers through a queue that a listener thread formats
+    and writes to stderr, so log I/O never blocks the event loop.
+
+    This runs from the startup hook rather than at import time, since
+    `python -m backend.main` imports this module twice (as __main__ and as
+    backend.main) and only the served copy's hooks run.
+    """
+    global _log_listener
+    backend_logger = logging.getLogger("backend")
+    backend_logger.setLevel(LOG_LEVEL)
+    backend_logger.propagate = False
+    if any(isinstance(h, logging.handlers.QueueHandler) for h in backend_logger.handlers):
+        return
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s")
+    )
+    _log_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    backend_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _log_listener.start()
+
+
+def _stop_logging():
+    """Flush pending log records and detach the queue handler."""
+    global _log_listener
+    if _log_listener is None:
+        return
+    _log_listener.stop()
+    backend_logger = logging.getLogger("backend")
+    for handler in list(backend_logger.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler) and handler.queue is _log_listener.queue:
+            backend_logger.removeHandler(handler)
+    backend_logger.propagate = True
+    _log_listener = None
+
 
 app = FastAPI(title="KT LLM Council API")
 
@@ -89,21 +141,92 @@ class Conversation(BaseModel):
 
 
 # ============================================================
-# Startup Event - Create Admin User
+# Server-Sent Events Helpers
+# ============================================================
+
+def _sse_event(event: Dict[str, Any]) -> bytes:
+    """Encode an event as a Server-Sent Events frame."""
+    return b"data: " + orjson.dumps(event) + b"\n\n"
+
+
+# Events without a payload are encoded once at import
+_SSE_STAGE1_START = _sse_event({'type': 'stage1_start'})
+_SSE_STAGE3_START = _sse_event({'type': 'stage3_start'})
+_SSE_COMPLETE = _sse_event({'type': 'complete'})
+
+
+# Yielded by an event generator before it waits on something slow, so that
+# everything buffered so far is sent to the client
+_SSE_FLUSH = object()
+
+
+async def _coalesce_sse(events: AsyncIterator[Any], threshold: int = 4096) -> AsyncIterator[bytes]:
+    """
+    Merge back-to-back SSE frames into a single write.
+
+    Frames are buffered until the source yields _SSE_FLUSH, the buffer reaches
+    threshold bytes, or the source is exhausted. Each write is one ASGI send
+    (and one TLS record under HTTPS) instead of one per event.
+
+    Args:
+        events: Async iterator of encoded frames and _SSE_FLUSH markers
+        threshold: Buffer size in bytes that forces a write
+
+    Yields:
+        Coalesced frame bytes
+    """
+    buffer = bytearray()
+    async for item in events:
+        if item is _SSE_FLUSH:
+            if buffer:
+                yield bytes(buffer)
+                buffer.clear()
+            continue
+
+        buffer += item
+        if len(buffer) >= threshold:
+            yield bytes(buffer)
+            buffer.clear()
+
+    if buffer:
+        yield bytes(buffer)
+
+
+# ============================================================
+# Startup / Shutdown Events
 # ============================================================
 
 @app.on_event("startup")
 async def startup_event():
-    """Create default admin user if no users exist."""
-    if not users.user_exists():
-        password_hash = hash_password(ADMIN_PASSWORD)
-        users.create_user(
-            email=ADMIN_EMAIL,
-            password_hash=password_hash,
-            name="Admin",
-            is_admin=True
-        )
-        print(f"Created default admin user: {ADMIN_EMAIL}")
+    """Create default admin user if no users exist and warm up password hashing."""
+    _start_logging()
+
+    # Only hash the admin password on a fresh database, and keep the SQLite
+    # work off the event loop while the other workers start up
+    if not await users.auser_exists():
+        password_hash = await hash_password_async(ADMIN_PASSWORD)
+        try:
+            await users.acreate_user(
+                email=ADMIN_EMAIL,
+                password_hash=password_hash,
+                name="Admin",
+                is_admin=True
+            )
+            print(f"Created default admin user: {ADMIN_EMAIL}")
+        except ValueError:
+            # Another worker process created it first
+            pass
+
+    await warm_up_password_hashing()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release pooled outbound connections and flush pending log records."""
+    await tts.close_client()
+    await openrouter.close_client()
+    await realtime_client_pool.close_all()
+    _stop_logging()
 
 
 # ============================================================
@@ -123,18 +246,25 @@ async def root():
 @app.post("/api/auth/login", response_model=LoginResponse)
 async def login(request: LoginRequest):
     """Login with email and password."""
-    user = users.get_user_by_email(request.email)
+    user = await users.aget_user_auth_by_email(request.email)
 
     if user is None:
+        # Take as long as a wrong password so valid emails can't be probed
+        await verify_dummy_password_async(request.password)
         raise HTTPException(status_code=401, detail="Invalid email or password")
 
-    if not verify_password(request.password, user["password_hash"]):
+    if not await verify_password_async(request.password, user.password_hash):
         raise HTTPException(status_code=401, detail="Invalid email or password")
 
-    token = create_token(user["id"], user["email"], user["is_admin"])
+    # Upgrade legacy bcrypt hashes and outdated Argon2 parameters
+    if password_needs_rehash(user.password_hash):
+        new_hash = await hash_password_async(request.password)
+        await users.aupdate_password_hash(user.id, new_hash)
+
+    token = create_token(user.id, user.email, user.is_admin)
 
-    # Remove password_hash from response
-    user_response = {k: v for k, v in user.items() if k != "password_hash"}
+    # Build response without password_hash
+    user_response = user.public_dict()
 
     return {"token": token, "user": user_response}
 
@@ -152,7 +282,7 @@ async def get_me(current_user: Dict[str, Any] = Depends(get_current_user)):
 @app.get("/api/admin/users", response_model=List[UserResponse])
 async def list_users(current_user: Dict[str, Any] = Depends(get_current_admin)):
     """List all users (admin only)."""
-    return users.list_users()
+    return await users.alist_users()
 
 
 @app.post("/api/admin/users", response_model=UserResponse)
@@ -162,8 +292,8 @@ async def create_user(
 ):
     """Create a new user (admin only)."""
     try:
-        password_hash = hash_password(request.password)
-        new_user = users.create_user(
+        password_hash = await hash_password_async(request.password)
+        new_user = await users.acreate_user(
             email=request.email,
             password_hash=password_hash,
             name=request.name,
@@ -184,7 +314,7 @@ async def delete_user(
     if user_id == current_user["id"]:
         raise HTTPException(status_code=400, detail="Cannot delete your own account")
 
-    deleted = users.delete_user(user_id)
+    deleted = await users.adelete_user(user_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -239,38 +369,40 @@ async def send_message(
     Send a message and run the 3-stage council process.
     Returns the complete response with all stages.
     """
-    # Check if conversation exists
-    conversation = storage.get_conversation(conversation_id)
+    # Changes are merged into the stored conversation when saved
+    conversation = storage.open_conversation(conversation_id)
     if conversation is None:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
     # Check ownership
-    if conversation.get("user_id") != current_user["id"]:
+    if conversation.user_id != current_user["id"]:
         raise HTTPException(status_code=403, detail="Access denied")
 
     # Check if this is the first message
-    is_first_message = len(conversation["messages"]) == 0
-
-    # Add user message
-    storage.add_user_message(conversation_id, request.content)
-
-    # If this is the first message, generate a title
-    if is_first_message:
-        title = await generate_conversation_title(request.content)
-        storage.update_conversation_title(conversation_id, title)
-
-    # Run the 3-stage council process
-    stage1_results, stage2_results, stage3_result, metadata = await run_full_council(
-        request.content
-    )
+    is_first_message = len(conversation.messages) == 0
+
+    with conversation:
+        # Add user message
+        conversation.add_user_message(request.content)
+        # Persist it before the long council run so a failure can't lose it
+        conversation.save()
+
+        # If this is the first message, generate a title
+        if is_first_message:
+            title = await generate_conversation_title(request.content)
+            conversation.set_title(title)
+
+        # Run the 3-stage council process
+        stage1_results, stage2_results, stage3_result, metadata = await run_full_council(
+            request.content
+        )
 
-    # Add assistant message with all stages
-    storage.add_assistant_message(
-        conversation_id,
-        stage1_results,
-        stage2_results,
-        stage3_result
-    )
+        # Add assistant message with all stages
+        conversation.add_assistant_message(
+            stage1_results,
+            stage2_results,
+            stage3_result
+        )
 
     # Return the complete response with metadata
     return {
@@ -291,67 +423,83 @@ async def send_message_stream(
     Send a message and stream the 3-stage council process.
     Returns Server-Sent Events as each stage completes.
     """
-    # Check if conversation exists
-    conversation = storage.get_conversation(conversation_id)
+    # Changes are merged into the stored conversation when saved
+    conversation = storage.open_conversation(conversation_id)
     if conversation is None:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
     # Check ownership
-    if conversation.get("user_id") != current_user["id"]:
+    if conversation.user_id != current_user["id"]:
         raise HTTPException(status_code=403, detail="Access denied")
 
     # Check if this is the first message
-    is_first_message = len(conversation["messages"]) == 0
+    is_first_message = len(conversation.messages) == 0
 
     async def event_generator():
         try:
-            # Add user message
-            storage.add_user_message(conversation_id, request.content)
-
-            # Start title generation in parallel (don't await yet)
-            title_task = None
-            if is_first_message:
-                title_task = asyncio.create_task(generate_conversation_title(request.content))
-
-            # Stage 1: Collect responses
-            yield f"data: {json.dumps({'type': 'stage1_start'})}\n\n"
-            stage1_results = await stage1_collect_responses(request.content)
-            yield f"data: {json.dumps({'type': 'stage1_complete', 'data': stage1_results})}\n\n"
-
-            # Stage 2: Collect rankings
-            yield f"data: {json.dumps({'type': 'stage2_start'})}\n\n"
-            stage2_results, label_to_model = await stage2_collect_rankings(request.content, stage1_results)
-            aggregate_rankings = calculate_aggregate_rankings(stage2_results, label_to_model)
-            yield f"data: {json.dumps({'type': 'stage2_complete', 'data': stage2_results, 'metadata': {'label_to_model': label_to_model, 'aggregate_rankings': aggregate_rankings}})}\n\n"
-
-            # Stage 3: Synthesize final answer
-            yield f"data: {json.dumps({'type': 'stage3_start'})}\n\n"
-            stage3_result = await stage3_synthesize_final(request.content, stage1_results, stage2_results)
-            yield f"data: {json.dumps({'type': 'stage3_complete', 'data': stage3_result})}\n\n"
-
-            # Wait for title generation if it was started
-            if title_task:
-                title = await title_task
-                storage.update_conversation_title(conversation_id, title)
-                yield f"data: {json.dumps({'type': 'title_complete', 'data': {'title': title}})}\n\n"
-
-            # Save complete assistant message
-            storage.add_assistant_message(
-                conversation_id,
-                stage1_results,
-                stage2_results,
-                stage3_result
-            )
-
-            # Send completion event
-            yield f"data: {json.dumps({'type': 'complete'})}\n\n"
+            with conversation:
+                # Add user message
+                conversation.add_user_message(request.content)
+                # Persist it before the long council run so a failure can't lose it
+                conversation.save()
+
+                # Start title generation in parallel (don't await yet)
+                title_task = None
+                if is_first_message:
+                    title_task = asyncio.create_task(generate_conversation_title(request.content))
+
+                # Stage 1: Collect responses, forwarding each one as it arrives
+                yield _SSE_STAGE1_START
+                yield _SSE_FLUSH
+                stage1_results = []
+                async for result in stage1_stream_responses(request.content):
+                    stage1_results.append(result)
+                    yield _sse_event({'type': 'stage1_partial', 'data': result})
+                    yield _SSE_FLUSH
+                yield _sse_event({'type': 'stage1_complete', 'data': stage1_results})
+
+                # Stage 2: Collect rankings, forwarding each one as it arrives
+                # The mapping goes out first so partial rankings render de-anonymized
+                label_to_model = create_label_to_model(stage1_results)
+                yield _sse_event({'type': 'stage2_start', 'metadata': {'label_to_model': label_to_model}})
+                yield _SSE_FLUSH
+                stage2_results = []
+                async for ranking in stage2_stream_rankings(request.content, stage1_results):
+                    stage2_results.append(ranking)
+                    yield _sse_event({'type': 'stage2_partial', 'data': ranking})
+                    yield _SSE_FLUSH
+                aggregate_rankings = calculate_aggregate_rankings(stage2_results, label_to_model)
+                yield _sse_event({'type': 'stage2_complete', 'data': stage2_results, 'metadata': {'label_to_model': label_to_model, 'aggregate_rankings': aggregate_rankings}})
+
+                # Stage 3: Synthesize final answer
+                yield _SSE_STAGE3_START
+                yield _SSE_FLUSH
+                stage3_result = await stage3_synthesize_final(request.content, stage1_results, stage2_results)
+                yield _sse_event({'type': 'stage3_complete', 'data': stage3_result})
+                yield _SSE_FLUSH
+
+                # Wait for title generation if it was started
+                if title_task:
+                    title = await title_task
+                    conversation.set_title(title)
+                    yield _sse_event({'type': 'title_complete', 'data': {'title': title}})
+
+                # Add complete assistant message
+                conversation.add_assistant_message(
+                    stage1_results,
+                    stage2_results,
+                    stage3_result
+                )
+
+            # Send completion event once everything is saved
+            yield _SSE_COMPLETE
 
         except Exception as e:
             # Send error event
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            yield _sse_event({'type': 'error', 'message': str(e)})
 
     return StreamingResponse(
-        event_generator(),
+        _coalesce_sse(event_generator()),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -375,15 +523,11 @@ async def voice_chat_endpoint(
         await websocket.close(code=4001, reason="Authentication required")
         return
 
-    from .auth import verify_token
-    from .users import get_user_by_id
-
-    payload = verify_token(token)
+    payload, current_user = await authenticate_token(token)
     if payload is None:
         await websocket.close(code=4001, reason="Invalid token")
         return
 
-    current_user = get_user_by_id(payload.get("sub"))
     if current_user is None:
         await websocket.close(code=4001, reason="User not found")
         return
@@ -426,4 +570,17 @@ async def voice_chat_endpoint(
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8005)
+    # Multiple workers need an import string; "auto" picks uvloop and
+    # httptools when they are installed and falls back where they aren't
+    uvicorn.run(
+        "backend.main:app",
+        host="0.0.0.0",
+        port=8005,
+        workers=WORKERS,
+        loop="auto",
+        http="auto",
+        ws="websockets",
+        # Long-lived SSE/voice clients reconnect less with a longer keep-alive
+        timeout_keep_alive=75,
+        backlog=2048
+    )
@@ -1,16 +1,59 @@
 """FastAPI middleware and dependencies for authentication."""
 
+import hashlib
+import time
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 from .auth import verify_token
-from .users import get_user_by_id
+from .cache import TTLCache
+from .users import aget_user_by_id
 
 
 # HTTP Bearer token scheme
 security = HTTPBearer()
 
+# Recently verified tokens -> (payload, user); the revocation window this
+# adds is documented at _USER_CACHE_TTL in users.py
+_token_cache = TTLCache(maxsize=10_000, ttl=5)
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Hash a token so raw credentials are not kept as cache keys."""
+    return hashlib.blake2b(token.encode('utf-8'), digest_size=16).digest()
+
+
+async def authenticate_token(token: str) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Verify a JWT token and load its user, using a short-lived cache.
+
+    Args:
+        token: JWT token string
+
+    Returns:
+        Tuple of (payload, user). payload is None if the token is invalid or
+        expired; user is None if the token's user does not exist.
+    """
+    key = _token_cache_key(token)
+    cached = _token_cache.get(key)
+    if cached is not None:
+        # Hand out copies so a caller mutating its user can't alter the cache
+        payload, user = cached
+        return dict(payload), dict(user)
+
+    payload = verify_token(token)
+    if payload is None:
+        return None, None
+
+    user = await aget_user_by_id(payload.get("sub"))
+    if user is None:
+        return payload, None
+
+    # Never cache past the token's own expiry
+    _token_cache.set(key, (payload, user), ttl=payload["exp"] - time.time())
+    return dict(payload), dict(user)
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security)
@@ -29,8 +72,8 @@ async def get_current_user(
     """
     token = credentials.credentials
 
-    # Verify token
-    payload = verify_token(token)
+    # Verify token and load user
+    payload, user = await authenticate_token(token)
     if payload is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -38,10 +81,6 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"}
         )
 
-    # Get user from database
-    user_id = payload.get("sub")
-    user = get_user_by_id(user_id)
-
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -94,11 +133,5 @@ async def get_optional_user(
     if credentials is None:
         return None
 
-    token = credentials.credentials
-    payload = verify_token(token)
-
-    if payload is None:
-        return None
-
-    user_id = payload.get("sub")
-    return get_user_by_id(user_id)
+    _, user = await authenticate_token(credentials.credentials)
+    return user
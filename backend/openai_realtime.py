@@ -3,8 +3,18 @@
 import asyncio
 import base64
 import json
+import time
+import orjson
 import websockets
-from typing import Optional, Callable, Awaitable
+from collections import deque
+from typing import Optional, Callable, Awaitable, Deque, Dict, Set, Tuple
+from websockets.protocol import State
+
+
+# input_audio_buffer.append messages are built by concatenation: base64 output
+# never needs JSON escaping, so json.dumps would only add copies.
+_AUDIO_APPEND_PREFIX = '{"type":"input_audio_buffer.append","audio":"'
+_AUDIO_APPEND_SUFFIX = '"}'
 
 
 class RealtimeClient:
@@ -18,6 +28,18 @@ class RealtimeClient:
         self.transcription: str = ""
         self._on_transcription: Optional[Callable[[str], Awaitable[None]]] = None
         self._connected = False
+        self.connected_at = 0.0
+        # Conversation items created this turn, deleted again before reuse
+        self._item_ids: list[str] = []
+        self._response_pending = False
+        # Item created by the latest commit; transcripts for other items are
+        # stale events from an earlier turn
+        self._committed_item_id: Optional[str] = None
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the WebSocket connection is still usable."""
+        return self._connected and self.ws is not None and self.ws.state is State.OPEN
 
     async def connect(self) -> bool:
         """Connect to OpenAI Realtime API."""
@@ -26,11 +48,19 @@ class RealtimeClient:
                 "Authorization": f"Bearer {self.api_key}",
                 "OpenAI-Beta": "realtime=v1"
             }
+            # PCM16 audio barely compresses, so per-message deflate would only
+            # cost CPU and latency on every frame
             self.ws = await websockets.connect(
                 self.REALTIME_API_URL,
-                additional_headers=headers
+                additional_headers=headers,
+                compression=None,
+                max_size=None,
+                write_limit=2**20,
+                ping_interval=20,
+                ping_timeout=20
             )
             self._connected = True
+            self.connected_at = time.monotonic()
 
             # Configure session for audio transcription only
             await self._configure_session()
@@ -65,12 +95,8 @@ class RealtimeClient:
             return
 
         # Encode audio as base64 and send
-        audio_base64 = base64.b64encode(audio_data).decode("utf-8")
-        message = {
-            "type": "input_audio_buffer.append",
-            "audio": audio_base64
-        }
-        await self.ws.send(json.dumps(message))
+        audio_base64 = base64.b64encode(audio_data).decode("ascii")
+        await self.ws.send(_AUDIO_APPEND_PREFIX + audio_base64 + _AUDIO_APPEND_SUFFIX)
 
     async def commit_audio(self):
         """Commit the audio buffer and request transcription."""
@@ -78,9 +104,11 @@ class RealtimeClient:
             return
 
         # Commit the audio buffer
+        self._committed_item_id = None
         await self.ws.send(json.dumps({"type": "input_audio_buffer.commit"}))
 
         # Create a response to trigger transcription
+        self._response_pending = True
         await self.ws.send(json.dumps({
             "type": "response.create",
             "response": {
@@ -101,11 +129,14 @@ class RealtimeClient:
 
         try:
             async for message in self.ws:
-                data = json.loads(message)
+                data = orjson.loads(message)
                 event_type = data.get("type", "")
+                self._track_event(event_type, data)
 
                 # Handle transcription events
                 if event_type == "conversation.item.input_audio_transcription.completed":
+                    if data.get("item_id") != self._committed_item_id:
+                        continue
                     transcription = data.get("transcript", "")
                     if self._on_transcription:
                         await self._on_transcription(transcription)
@@ -137,6 +168,73 @@ class RealtimeClient:
 
         return transcription if transcription else None
 
+    def _track_event(self, event_type: str, data: dict):
+        """Record server state that reset() has to undo."""
+        if event_type == "conversation.item.created":
+            item_id = data.get("item", {}).get("id")
+            if item_id:
+                self._item_ids.append(item_id)
+        elif event_type == "input_audio_buffer.committed":
+            self._committed_item_id = data.get("item_id")
+        elif event_type == "response.done":
+            self._response_pending = False
+
+    async def reset(self, timeout: float = 5.0) -> bool:
+        """Return the session to a clean state so it can be reused.
+
+        Waits for any in-flight response to finish, deletes this turn's
+        conversation items and clears the input audio buffer, then reads
+        until the server has acknowledged all of it. Every other event
+        received meanwhile, such as a late transcript, is dropped, so the
+        next turn starts with nothing from this one queued on the socket.
+
+        Args:
+            timeout: Seconds to wait for the response and the acknowledgements
+
+        Returns:
+            True if the session can be reused, False if it should be closed
+        """
+        if not self.is_open:
+            return False
+
+        try:
+            deadline = time.monotonic() + timeout
+
+            async def next_event() -> Tuple[str, dict]:
+                message = await asyncio.wait_for(self.ws.recv(), deadline - time.monotonic())
+                data = orjson.loads(message)
+                return data.get("type", ""), data
+
+            while self._response_pending:
+                event_type, data = await next_event()
+                if event_type == "error":
+                    return False
+                self._track_event(event_type, data)
+
+            pending_deletes = set(self._item_ids)
+            for item_id in pending_deletes:
+                await self.ws.send(json.dumps({"type": "conversation.item.delete", "item_id": item_id}))
+            await self.ws.send(json.dumps({"type": "input_audio_buffer.clear"}))
+
+            buffer_cleared = False
+            while pending_deletes or not buffer_cleared:
+                event_type, data = await next_event()
+                if event_type == "conversation.item.deleted":
+                    pending_deletes.discard(data.get("item_id"))
+                elif event_type == "input_audio_buffer.cleared":
+                    buffer_cleared = True
+                elif event_type == "error":
+                    # Likely a failed delete; the session state is unknown
+                    return False
+        except Exception:
+            return False
+
+        self._item_ids.clear()
+        self._committed_item_id = None
+        self.transcription = ""
+        self._on_transcription = None
+        return True
+
     async def close(self):
         """Close the WebSocket connection."""
         self._connected = False
@@ -149,6 +247,94 @@ class RealtimeClient:
         self._on_transcription = callback
 
 
+class RealtimeClientPool:
+    """Keeps connected RealtimeClients for reuse across recordings.
+
+    Each turn otherwise pays a full WSS handshake plus session.update before
+    any audio can be sent. Clients are reset before they go back into the
+    pool and retired once they reach max_age, well inside the API's session
+    time limit.
+    """
+
+    def __init__(self, max_idle_per_key: int = 4, max_age: float = 600.0, idle_timeout: float = 120.0):
+        """
+        Args:
+            max_idle_per_key: Idle clients kept per API key
+            max_age: Seconds after connecting before a client is retired
+            idle_timeout: Seconds an idle client is kept before it is closed
+        """
+        self.max_idle_per_key = max_idle_per_key
+        self.max_age = max_age
+        self.idle_timeout = idle_timeout
+        self._idle: Dict[str, Deque[Tuple[float, RealtimeClient]]] = {}
+        self._releasing: Set[asyncio.Task] = set()
+
+    def _is_reusable(self, client: RealtimeClient, now: float) -> bool:
+        """Whether a client is still connected and young enough to reuse."""
+        return client.is_open and now - client.connected_at < self.max_age
+
+    async def acquire(self, api_key: str) -> Optional[RealtimeClient]:
+        """Get a connected client, reusing an idle one when possible.
+
+        Args:
+            api_key: OpenAI API key
+
+        Returns:
+            Connected client, or None if connecting failed
+        """
+        idle = self._idle.get(api_key)
+        now = time.monotonic()
+        while idle:
+            released_at, client = idle.pop()
+            if now - released_at < self.idle_timeout and self._is_reusable(client, now):
+                return client
+            await client.close()
+
+        client = RealtimeClient(api_key)
+        if not await client.connect():
+            await client.close()
+            return None
+        return client
+
+    async def release(self, client: RealtimeClient):
+        """Reset a client and keep it for reuse, or close it.
+
+        Args:
+            client: Client previously returned by acquire()
+        """
+        if not self._is_reusable(client, time.monotonic()) or not await client.reset():
+            await client.close()
+            return
+
+        idle = self._idle.setdefault(client.api_key, deque())
+        idle.append((time.monotonic(), client))
+        while len(idle) > self.max_idle_per_key:
+            _, oldest = idle.popleft()
+            await oldest.close()
+
+    def release_soon(self, client: RealtimeClient):
+        """Release a client in the background without waiting for the reset."""
+        task = asyncio.create_task(self.release(client))
+        self._releasing.add(task)
+        task.add_done_callback(self._releasing.discard)
+
+    async def close_all(self):
+        """Close every pooled client (call on application shutdown)."""
+        for task in list(self._releasing):
+            task.cancel()
+        await asyncio.gather(*self._releasing, return_exceptions=True)
+
+        for idle in self._idle.values():
+            while idle:
+                _, client = idle.pop()
+                await client.close()
+        self._idle.clear()
+
+
+# Process-wide pool used by voice sessions
+realtime_client_pool = RealtimeClientPool()
+
+
 async def transcribe_audio(api_key: str, audio_chunks: list[bytes]) -> Optional[str]:
     """Transcribe audio using OpenAI Realtime API.
 
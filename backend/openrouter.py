@@ -1,14 +1,24 @@
 """OpenRouter API client for making LLM requests."""
 
+import asyncio
 import httpx
-from typing import List, Dict, Any, Optional
+import orjson
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple
 from .config import OPENROUTER_API_KEY, OPENROUTER_API_URL
 
 
+# Shared client so council queries reuse warm TLS connections to OpenRouter
+_client = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    timeout=120.0
+)
+
+
 async def query_model(
     model: str,
     messages: List[Dict[str, str]],
-    timeout: float = 120.0
+    timeout: float = 120.0,
+    client: Optional[httpx.AsyncClient] = None
 ) -> Optional[Dict[str, Any]]:
     """
     Query a single model via OpenRouter API.
@@ -17,6 +27,7 @@ async def query_model(
         model: OpenRouter model identifier (e.g., "openai/gpt-4o")
         messages: List of message dicts with 'role' and 'content'
         timeout: Request timeout in seconds
+        client: HTTP client to use instead of the shared one
 
     Returns:
         Response dict with 'content' and optional 'reasoning_details', or None if failed
@@ -31,28 +42,96 @@ async def query_model(
         "messages": messages,
     }
 
-    try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
-                OPENROUTER_API_URL,
-                headers=headers,
-                json=payload
-            )
-            response.raise_for_status()
+    client = client or _client
 
-            data = response.json()
-            message = data['choices'][0]['message']
-
-            return {
-                'content': message.get('content'),
-                'reasoning_details': message.get('reasoning_details')
-            }
+    try:
+        response = await client.post(
+            OPENROUTER_API_URL,
+            headers=headers,
+            json=payload,
+            timeout=timeout
+        )
+        response.raise_for_status()
+
+        data = response.json()
+        message = data['choices'][0]['message']
+
+        return {
+            'content': message.get('content'),
+            'reasoning_details': message.get('reasoning_details')
+        }
 
     except Exception as e:
         print(f"Error querying model {model}: {e}")
         return None
 
 
+async def query_model_stream(
+    model: str,
+    messages: List[Dict[str, str]],
+    timeout: float = 120.0,
+    client: Optional[httpx.AsyncClient] = None
+) -> AsyncIterator[str]:
+    """
+    Query a single model via OpenRouter API, streaming the response.
+
+    Args:
+        model: OpenRouter model identifier (e.g., "openai/gpt-4o")
+        messages: List of message dicts with 'role' and 'content'
+        timeout: Request timeout in seconds
+        client: HTTP client to use instead of the shared one
+
+    Yields:
+        Content deltas as they are generated
+
+    Raises:
+        Exception: If the request fails or the stream breaks off, so callers
+            can tell a truncated response from a complete one
+    """
+    headers = {
+        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
+        "Content-Type": "application/json",
+    }
+
+    payload = {
+        "model": model,
+        "messages": messages,
+        "stream": True,
+    }
+
+    client = client or _client
+
+    try:
+        async with client.stream(
+            "POST",
+            OPENROUTER_API_URL,
+            headers=headers,
+            json=payload,
+            timeout=timeout
+        ) as response:
+            response.raise_for_status()
+
+            # Server-sent events; lines starting with ':' are keep-alive comments
+            async for line in response.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                data = line[len("data: "):]
+                if data == "[DONE]":
+                    break
+
+                chunk = orjson.loads(data)
+                choices = chunk.get('choices')
+                if not choices:
+                    continue
+                content = choices[0].get('delta', {}).get('content')
+                if content:
+                    yield content
+
+    except Exception as e:
+        print(f"Error streaming model {model}: {e}")
+        raise
+
+
 async def query_models_parallel(
     models: List[str],
     messages: List[Dict[str, str]]
@@ -67,8 +146,6 @@ async def query_models_parallel(
     Returns:
         Dict mapping model identifier to response dict (or None if failed)
     """
-    import asyncio
-
     # Create tasks for all models
     tasks = [query_model(model, messages) for model in models]
 
@@ -77,3 +154,37 @@ async def query_models_parallel(
 
     # Map models to their responses
     return {model: response for model, response in zip(models, responses)}
+
+
+async def query_models_as_completed(
+    models: List[str],
+    messages: List[Dict[str, str]]
+) -> AsyncIterator[Tuple[str, Optional[Dict[str, Any]]]]:
+    """
+    Query multiple models in parallel, yielding each result as it arrives.
+
+    Args:
+        models: List of OpenRouter model identifiers
+        messages: List of message dicts to send to each model
+
+    Yields:
+        Tuples of (model identifier, response dict or None if failed),
+        fastest model first
+    """
+    async def query(model: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        return model, await query_model(model, messages)
+
+    tasks = [asyncio.create_task(query(model)) for model in models]
+
+    try:
+        for next_result in asyncio.as_completed(tasks):
+            yield await next_result
+    finally:
+        # Don't leave requests running if the consumer stops early
+        for task in tasks:
+            task.cancel()
+
+
+async def close_client():
+    """Close the shared OpenRouter HTTP client (call on application shutdown)."""
+    await _client.aclose()
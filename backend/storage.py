@@ -178,3 +178,123 @@ def update_conversation_title(conversation_id: str, title: str):
 
     conversation["title"] = title
     save_conversation(conversation)
+
+
+class ConversationHandle:
+    """
+    A loaded conversation whose changes are batched and written back together.
+
+    Changes are recorded as pending appends and title updates. save() re-reads
+    the file and applies them to the current contents, so writes made to the
+    same conversation in the meantime (another tab, a voice turn) are kept
+    rather than overwritten by this snapshot.
+
+    Use as a context manager; pending changes are saved on exit, including
+    when the block raises.
+    """
+
+    def __init__(self, conversation: Dict[str, Any]):
+        self.conversation = conversation
+        self._pending_messages: List[Dict[str, Any]] = []
+        self._pending_title: Optional[str] = None
+
+    @property
+    def user_id(self) -> Optional[str]:
+        """Owner user ID."""
+        return self.conversation.get("user_id")
+
+    @property
+    def messages(self) -> List[Dict[str, Any]]:
+        """Messages in the conversation, including unsaved ones."""
+        return self.conversation["messages"]
+
+    def _append_message(self, message: Dict[str, Any]):
+        """Append a message in memory and queue it for the next save."""
+        self.messages.append(message)
+        self._pending_messages.append(message)
+
+    def add_user_message(self, content: str):
+        """
+        Add a user message.
+
+        Args:
+            content: User message content
+        """
+        self._append_message({
+            "role": "user",
+            "content": content
+        })
+
+    def add_assistant_message(
+        self,
+        stage1: List[Dict[str, Any]],
+        stage2: List[Dict[str, Any]],
+        stage3: Dict[str, Any]
+    ):
+        """
+        Add an assistant message with all 3 stages.
+
+        Args:
+            stage1: List of individual model responses
+            stage2: List of model rankings
+            stage3: Final synthesized response
+        """
+        self._append_message({
+            "role": "assistant",
+            "stage1": stage1,
+            "stage2": stage2,
+            "stage3": stage3
+        })
+
+    def set_title(self, title: str):
+        """
+        Update the title.
+
+        Args:
+            title: New title for the conversation
+        """
+        self.conversation["title"] = title
+        self._pending_title = title
+
+    def save(self):
+        """Apply pending changes to the stored conversation and write it."""
+        if not self._pending_messages and self._pending_title is None:
+            return
+
+        # Merge into the current file contents rather than overwriting them
+        # with the snapshot loaded when the handle was opened
+        current = get_conversation(self.conversation["id"])
+        if current is None:
+            # Conversation was deleted meanwhile; don't resurrect it
+            return
+
+        current["messages"].extend(self._pending_messages)
+        if self._pending_title is not None:
+            current["title"] = self._pending_title
+        save_conversation(current)
+
+        self.conversation = current
+        self._pending_messages = []
+        self._pending_title = None
+
+    def __enter__(self) -> "ConversationHandle":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.save()
+
+
+def open_conversation(conversation_id: str) -> Optional[ConversationHandle]:
+    """
+    Load a conversation for a batch of modifications.
+
+    Args:
+        conversation_id: Unique identifier for the conversation
+
+    Returns:
+        ConversationHandle or None if not found
+    """
+    conversation = get_conversation(conversation_id)
+    if conversation is None:
+        return None
+    return ConversationHandle(conversation)
@@ -1,7 +1,111 @@
 """Text-to-Speech using OpenAI TTS API."""
 
+import asyncio
+import hashlib
+import os
+import threading
+import uuid
 import httpx
-from typing import AsyncGenerator, Optional
+from pathlib import Path
+from typing import AsyncGenerator, Optional, Tuple
+
+from .config import TTS_CACHE_DIR, TTS_CACHE_MAX_BYTES
+
+
+# Shared client so repeated TTS requests reuse a warm TLS connection
+_tts_client = httpx.AsyncClient(
+    limits=httpx.Limits(max_keepalive_connections=20),
+    timeout=60.0
+)
+
+
+_CHUNK_SIZE = 4096
+
+_TTS_URL = "https://api.openai.com/v1/audio/speech"
+
+
+def _cache_path(text: str, voice: str, model: str, response_format: str) -> Path:
+    """Get the cache file path for a synthesis request."""
+    key = hashlib.blake2b(
+        f"{model}|{voice}|{response_format}|{text}".encode('utf-8'), digest_size=16
+    ).hexdigest()
+    return Path(TTS_CACHE_DIR) / f"{key}.{response_format}"
+
+
+# Running total of the cache directory size, computed on first use and then
+# kept up to date on writes, so a miss doesn't rescan the whole directory
+_cache_size: Optional[int] = None
+_cache_lock = threading.Lock()
+
+
+def _scan_cache() -> Tuple[int, list]:
+    """Return total size and (mtime, size, path) entries of the cache files."""
+    entries = []
+    total = 0
+    for entry in os.scandir(TTS_CACHE_DIR):
+        if entry.is_file() and ".tmp-" not in entry.name:
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+    return total, entries
+
+
+def _prune_cache() -> int:
+    """Delete least-recently-used cache files until under TTS_CACHE_MAX_BYTES.
+
+    Returns:
+        Cache size after pruning
+    """
+    total, entries = _scan_cache()
+    if total <= TTS_CACHE_MAX_BYTES:
+        return total
+
+    entries.sort()
+    for _, size, path in entries:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+        if total <= TTS_CACHE_MAX_BYTES:
+            break
+    return total
+
+
+def _read_cached(cache_path: Path) -> Optional[bytes]:
+    """Read a cached synthesis and mark it recently used (runs in a thread)."""
+    try:
+        with open(cache_path, 'rb') as f:
+            data = f.read()
+        os.utime(cache_path)
+        return data
+    except FileNotFoundError:
+        return None
+
+
+def _store_cached(cache_path: Path, data: bytes):
+    """Publish a synthesis to the cache, pruning if over budget (runs in a thread)."""
+    global _cache_size
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.tmp-{uuid.uuid4().hex}")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+    with _cache_lock:
+        if _cache_size is None:
+            _cache_size = _scan_cache()[0]
+        else:
+            _cache_size += len(data)
+        if _cache_size > TTS_CACHE_MAX_BYTES:
+            _cache_size = _prune_cache()
 
 
 async def text_to_speech_stream(
@@ -9,21 +113,34 @@ async def text_to_speech_stream(
     text: str,
     voice: str = "alloy",
     model: str = "tts-1",
-    response_format: str = "mp3"
+    response_format: str = "mp3",
+    client: Optional[httpx.AsyncClient] = None
 ) -> AsyncGenerator[bytes, None]:
     """Stream text-to-speech audio from OpenAI API.
 
+    Audio is cached on disk by (model, voice, format, text), so repeated
+    utterances are replayed without calling the API. Cache file I/O runs in
+    worker threads to keep it off the event loop.
+
     Args:
         api_key: OpenAI API key
         text: Text to convert to speech
         voice: Voice to use (alloy, echo, fable, onyx, nova, shimmer)
         model: TTS model (tts-1 or tts-1-hd)
         response_format: Audio format (mp3, opus, aac, flac, wav, pcm)
+        client: HTTP client to use instead of the shared one
 
     Yields:
         Audio data chunks
     """
-    url = "https://api.openai.com/v1/audio/speech"
+    cache_path = _cache_path(text, voice, model, response_format)
+
+    # Cached path: replay the stored audio
+    cached = await asyncio.to_thread(_read_cached, cache_path)
+    if cached is not None:
+        for start in range(0, len(cached), _CHUNK_SIZE):
+            yield cached[start:start + _CHUNK_SIZE]
+        return
 
     headers = {
         "Authorization": f"Bearer {api_key}",
@@ -37,20 +154,24 @@ async def text_to_speech_stream(
         "response_format": response_format
     }
 
-    async with httpx.AsyncClient() as client:
-        async with client.stream(
-            "POST",
-            url,
-            headers=headers,
-            json=payload,
-            timeout=60.0
-        ) as response:
-            if response.status_code != 200:
-                error_text = await response.aread()
-                raise Exception(f"TTS API error: {response.status_code} - {error_text}")
+    # Network path: keep the chunks and publish them to the cache only once
+    # the whole response has been received
+    chunks = []
+    async with (client or _tts_client).stream(
+        "POST",
+        _TTS_URL,
+        headers=headers,
+        json=payload
+    ) as response:
+        if response.status_code != 200:
+            error_text = await response.aread()
+            raise Exception(f"TTS API error: {response.status_code} - {error_text}")
 
-            async for chunk in response.aiter_bytes(chunk_size=4096):
-                yield chunk
+        async for chunk in response.aiter_bytes(chunk_size=_CHUNK_SIZE):
+            chunks.append(chunk)
+            yield chunk
+
+    await asyncio.to_thread(_store_cached, cache_path, b"".join(chunks))
 
 
 async def text_to_speech(
@@ -58,7 +179,8 @@ async def text_to_speech(
     text: str,
     voice: str = "alloy",
     model: str = "tts-1",
-    response_format: str = "mp3"
+    response_format: str = "mp3",
+    client: Optional[httpx.AsyncClient] = None
 ) -> Optional[bytes]:
     """Convert text to speech and return complete audio.
 
@@ -68,6 +190,7 @@ async def text_to_speech(
         voice: Voice to use (alloy, echo, fable, onyx, nova, shimmer)
         model: TTS model (tts-1 or tts-1-hd)
         response_format: Audio format (mp3, opus, aac, flac, wav, pcm)
+        client: HTTP client to use instead of the shared one
 
     Returns:
         Complete audio data or None on error
@@ -75,10 +198,28 @@ async def text_to_speech(
     try:
         chunks = []
         async for chunk in text_to_speech_stream(
-            api_key, text, voice, model, response_format
+            api_key, text, voice, model, response_format, client
         ):
             chunks.append(chunk)
         return b"".join(chunks)
     except Exception as e:
         print(f"TTS error: {e}")
         return None
+
+
+async def warm_up(client: Optional[httpx.AsyncClient] = None):
+    """Open a pooled connection to the TTS API ahead of the first request.
+
+    Args:
+        client: HTTP client to warm up instead of the shared one
+    """
+    try:
+        await (client or _tts_client).head(_TTS_URL, timeout=5.0)
+    except httpx.HTTPError:
+        # Only an optimization; the real request opens its own connection
+        pass
+
+
+async def close_client():
+    """Close the shared TTS HTTP client (call on application shutdown)."""
+    await _tts_client.aclose()
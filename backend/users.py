@@ -1,14 +1,88 @@
 """SQLite-based user storage for authentication."""
 
+import asyncio
+import queue
 import sqlite3
+import threading
 import uuid
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List, NamedTuple
 from pathlib import Path
 
+from .cache import TTLCache
 from .config import USERS_DB
 
 
+class UserAuth(NamedTuple):
+    """User row needed to authenticate a login, password_hash last."""
+    id: str
+    email: str
+    name: str
+    is_admin: bool
+    created_at: str
+    password_hash: str
+
+    def public_dict(self) -> Dict[str, Any]:
+        """User fields safe to return to clients (without password_hash)."""
+        return dict(zip(self._fields[:-1], self[:-1]))
+
+
+# Public user columns, in the order list queries select them
+_USER_COLUMNS = ("id", "email", "name", "is_admin", "created_at")
+
+# Statements shared by every call, so pooled connections keep them prepared
+_SQL_INSERT = (
+    "INSERT INTO users (id, email, password_hash, name, is_admin, created_at) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_SQL_GET_BY_ID = "SELECT id, email, name, is_admin, created_at FROM users WHERE id = ?"
+# The planner prefers the UNIQUE autoindex, which still needs a table probe
+# for the row, so name the covering index explicitly
+_SQL_GET_AUTH_BY_EMAIL = (
+    "SELECT id, email, name, is_admin, created_at, password_hash "
+    "FROM users INDEXED BY idx_users_email_covering WHERE email = ?"
+)
+_SQL_UPDATE_PASSWORD_HASH = "UPDATE users SET password_hash = ? WHERE id = ?"
+_SQL_LIST = "SELECT id, email, name, is_admin, created_at FROM users ORDER BY created_at DESC"
+_SQL_DELETE = "DELETE FROM users WHERE id = ?"
+_SQL_ANY_USER = "SELECT 1 FROM users LIMIT 1"
+
+# Idle connections kept for reuse; extra connections opened under load are
+# closed instead of returned
+_POOL_SIZE = 8
+_pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=_POOL_SIZE)
+
+# Per-connection settings: commits skip the fsync that WAL makes
+# unnecessary for durability against process crashes, and temp tables and
+# a 64 MB page cache stay in memory
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Process-local cache of public user rows by id, used by token checks.
+# Writes through this module invalidate it immediately, but other worker
+# processes keep serving their copy until the TTL lapses. Together with the
+# token cache in middleware.py (also 5 s), a deleted user can therefore keep
+# being accepted for up to 10 s on other workers and 5 s on the worker that
+# deleted it. Keep this note in step with either TTL. Login lookups, which
+# carry password_hash, are never cached.
+_USER_CACHE_TTL = 5
+_user_by_id_cache = TTLCache(maxsize=4096, ttl=_USER_CACHE_TTL)
+# Bumped on every invalidation so a lookup that raced with a write doesn't
+# put the stale row back into the cache
+_user_cache_generation = 0
+_user_cache_lock = threading.Lock()
+
+# Set once a user is known to exist; cleared again on delete
+_any_user_exists = False
+
+_init_lock = threading.Lock()
+_initialized = False
+
+
 def ensure_db():
     """Ensure the database and tables exist."""
     Path(USERS_DB).parent.mkdir(parents=True, exist_ok=True)
@@ -16,6 +90,8 @@ def ensure_db():
     conn = sqlite3.connect(USERS_DB)
     cursor = conn.cursor()
 
+    # WAL is persistent in the database file, so set it once here
+    cursor.execute("PRAGMA journal_mode=WAL")
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS users (
             id TEXT PRIMARY KEY,
@@ -26,17 +102,70 @@ def ensure_db():
             created_at TEXT NOT NULL
         )
     """)
+    # Covers the login lookup so it is answered from the index alone
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_users_email_covering
+        ON users(email, id, name, is_admin, created_at, password_hash)
+    """)
 
     conn.commit()
     conn.close()
 
 
+def _init_once():
+    """Run ensure_db() the first time a connection is requested."""
+    global _initialized
+    if _initialized:
+        return
+    with _init_lock:
+        if not _initialized:
+            ensure_db()
+            _initialized = True
+
+
 def get_connection() -> sqlite3.Connection:
-    """Get a database connection."""
-    ensure_db()
-    conn = sqlite3.connect(USERS_DB)
-    conn.row_factory = sqlite3.Row
-    return conn
+    """
+    Get a database connection from the pool.
+
+    Connections are in autocommit mode and may be used from any thread.
+    Hand them back with release_connection() instead of closing them.
+    """
+    _init_once()
+    try:
+        return _pool.get_nowait()
+    except queue.Empty:
+        conn = sqlite3.connect(
+            USERS_DB,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+
+def release_connection(conn: sqlite3.Connection):
+    """Return a connection obtained from get_connection() to the pool."""
+    try:
+        _pool.put_nowait(conn)
+    except queue.Full:
+        conn.close()
+
+
+def _mark_user_exists():
+    """Remember that at least one user exists."""
+    global _any_user_exists
+    _any_user_exists = True
+
+
+def _invalidate_user(user_id: str):
+    """Drop the cached row for a user after it was written."""
+    global _user_cache_generation
+    with _user_cache_lock:
+        _user_cache_generation += 1
+        _user_by_id_cache.pop(user_id)
 
 
 def create_user(email: str, password_hash: str, name: str, is_admin: bool = False) -> Dict[str, Any]:
@@ -45,33 +174,30 @@ def create_user(email: str, password_hash: str, name: str, is_admin: bool = Fals
 
     Args:
         email: User email (unique)
-        password_hash: Bcrypt-hashed password
+        password_hash: Hashed password
         name: Display name
         is_admin: Whether user has admin privileges
 
     Returns:
         Created user dict (without password_hash)
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-
     user_id = str(uuid.uuid4())
     created_at = datetime.utcnow().isoformat()
 
+    conn = get_connection()
     try:
+        cursor = conn.cursor()
         cursor.execute(
-            """
-            INSERT INTO users (id, email, password_hash, name, is_admin, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
+            _SQL_INSERT,
             (user_id, email, password_hash, name, is_admin, created_at)
         )
-        conn.commit()
     except sqlite3.IntegrityError:
-        conn.close()
         raise ValueError(f"User with email {email} already exists")
+    finally:
+        release_connection(conn)
 
-    conn.close()
+    _invalidate_user(user_id)
+    _mark_user_exists()
 
     return {
         "id": user_id,
@@ -82,6 +208,58 @@ def create_user(email: str, password_hash: str, name: str, is_admin: bool = Fals
     }
 
 
+def bulk_create_users(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Create several users in a single transaction.
+
+    Either every user is created or, if any email is already taken, none are.
+
+    Args:
+        rows: Dicts with email, password_hash, name and optional is_admin
+
+    Returns:
+        List of created user dicts (without password_hash)
+    """
+    created_at = datetime.utcnow().isoformat()
+    users = [
+        {
+            "id": str(uuid.uuid4()),
+            "email": row["email"],
+            "name": row["name"],
+            "is_admin": row.get("is_admin", False),
+            "created_at": created_at
+        }
+        for row in rows
+    ]
+    params = [
+        (user["id"], user["email"], row["password_hash"], user["name"],
+         user["is_admin"], user["created_at"])
+        for user, row in zip(users, rows)
+    ]
+
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("BEGIN")
+        try:
+            cursor.executemany(_SQL_INSERT, params)
+            cursor.execute("COMMIT")
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+    except sqlite3.IntegrityError as e:
+        raise ValueError(f"One or more users already exist: {e}")
+    finally:
+        release_connection(conn)
+
+    for user in users:
+        _invalidate_user(user["id"])
+    if users:
+        _mark_user_exists()
+
+    return users
+
+
 def get_user_by_id(user_id: str) -> Optional[Dict[str, Any]]:
     """
     Get a user by ID.
@@ -92,20 +270,27 @@ def get_user_by_id(user_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         User dict (without password_hash) or None if not found
     """
-    conn = get_connection()
-    cursor = conn.cursor()
+    cached = _user_by_id_cache.get(user_id)
+    if cached is not None:
+        return dict(cached)
 
-    cursor.execute(
-        "SELECT id, email, name, is_admin, created_at FROM users WHERE id = ?",
-        (user_id,)
-    )
-    row = cursor.fetchone()
-    conn.close()
+    generation = _user_cache_generation
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(_SQL_GET_BY_ID, (user_id,))
+        row = cursor.fetchone()
+    finally:
+        release_connection(conn)
 
     if row is None:
         return None
 
-    return dict(row)
+    user = dict(row)
+    with _user_cache_lock:
+        if generation == _user_cache_generation:
+            _user_by_id_cache.set(user_id, user)
+    return dict(user)
 
 
 def get_user_by_email(email: str) -> Optional[Dict[str, Any]]:
@@ -118,39 +303,90 @@ def get_user_by_email(email: str) -> Optional[Dict[str, Any]]:
     Returns:
         User dict (with password_hash) or None if not found
     """
-    conn = get_connection()
-    cursor = conn.cursor()
+    user = get_user_auth_by_email(email)
+    if user is None:
+        return None
 
-    cursor.execute(
-        "SELECT id, email, password_hash, name, is_admin, created_at FROM users WHERE email = ?",
-        (email,)
-    )
-    row = cursor.fetchone()
-    conn.close()
+    return user._asdict()
+
+
+def get_user_auth_by_email(email: str) -> Optional[UserAuth]:
+    """
+    Get the fields needed to authenticate a login by email.
+
+    Args:
+        email: User email
+
+    Returns:
+        UserAuth tuple or None if not found
+    """
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(_SQL_GET_AUTH_BY_EMAIL, (email,))
+        row = cursor.fetchone()
+    finally:
+        release_connection(conn)
 
     if row is None:
         return None
 
-    return dict(row)
+    return UserAuth(*row)
 
 
-def list_users() -> List[Dict[str, Any]]:
+def update_password_hash(user_id: str, password_hash: str) -> bool:
     """
-    List all users.
+    Replace a user's password hash.
+
+    Args:
+        user_id: User identifier
+        password_hash: New hashed password
 
     Returns:
-        List of user dicts (without password_hash)
+        True if the user was updated, False if not found
     """
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(_SQL_UPDATE_PASSWORD_HASH, (password_hash, user_id))
+        updated = cursor.rowcount > 0
+    finally:
+        release_connection(conn)
+
+    _invalidate_user(user_id)
+
+    return updated
+
+
+def iter_users() -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over all users, newest first, without loading them all at once.
+
+    The pooled connection is held until the iterator is exhausted or closed.
+
+    Yields:
+        User dicts (without password_hash)
+    """
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+        # Plain tuples are cheaper to build than sqlite3.Row objects
+        cursor.row_factory = None
+        cursor.execute(_SQL_LIST)
+        for row in cursor:
+            yield dict(zip(_USER_COLUMNS, row))
+    finally:
+        release_connection(conn)
 
-    cursor.execute(
-        "SELECT id, email, name, is_admin, created_at FROM users ORDER BY created_at DESC"
-    )
-    rows = cursor.fetchall()
-    conn.close()
 
-    return [dict(row) for row in rows]
+def list_users() -> List[Dict[str, Any]]:
+    """
+    List all users.
+
+    Returns:
+        List of user dicts (without password_hash)
+    """
+    return list(iter_users())
 
 
 def delete_user(user_id: str) -> bool:
@@ -163,25 +399,91 @@ def delete_user(user_id: str) -> bool:
     Returns:
         True if user was deleted, False if not found
     """
+    global _any_user_exists
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(_SQL_DELETE, (user_id,))
+        deleted = cursor.rowcount > 0
+    finally:
+        release_connection(conn)
 
-    cursor.execute("DELETE FROM users WHERE id = ?", (user_id,))
-    deleted = cursor.rowcount > 0
-
-    conn.commit()
-    conn.close()
+    _invalidate_user(user_id)
+    if deleted:
+        _any_user_exists = False
 
     return deleted
 
 
 def user_exists() -> bool:
     """Check if any users exist in the database."""
+    if _any_user_exists:
+        return True
+
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(_SQL_ANY_USER)
+        exists = cursor.fetchone() is not None
+    finally:
+        release_connection(conn)
+
+    if exists:
+        _mark_user_exists()
+    return exists
+
+
+# Async wrappers for callers on the event loop. SQLite work runs in the
+# default thread pool; cached id lookups are answered without leaving the loop.
+
+async def aget_user_by_id(user_id: str) -> Optional[Dict[str, Any]]:
+    """Async version of get_user_by_id()."""
+    cached = _user_by_id_cache.get(user_id)
+    if cached is not None:
+        return dict(cached)
+    return await asyncio.to_thread(get_user_by_id, user_id)
+
+
+async def aget_user_auth_by_email(email: str) -> Optional[UserAuth]:
+    """Async version of get_user_auth_by_email()."""
+    return await asyncio.to_thread(get_user_auth_by_email, email)
+
+
+async def aget_user_by_email(email: str) -> Optional[Dict[str, Any]]:
+    """Async version of get_user_by_email()."""
+    user = await aget_user_auth_by_email(email)
+    if user is None:
+        return None
+    return user._asdict()
+
+
+async def acreate_user(email: str, password_hash: str, name: str, is_admin: bool = False) -> Dict[str, Any]:
+    """Async version of create_user()."""
+    return await asyncio.to_thread(create_user, email, password_hash, name, is_admin)
+
+
+async def abulk_create_users(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Async version of bulk_create_users()."""
+    return await asyncio.to_thread(bulk_create_users, rows)
+
+
+async def aupdate_password_hash(user_id: str, password_hash: str) -> bool:
+    """Async version of update_password_hash()."""
+    return await asyncio.to_thread(update_password_hash, user_id, password_hash)
+
+
+async def alist_users() -> List[Dict[str, Any]]:
+    """Async version of list_users()."""
+    return await asyncio.to_thread(list_users)
+
+
+async def adelete_user(user_id: str) -> bool:
+    """Async version of delete_user()."""
+    return await asyncio.to_thread(delete_user, user_id)
 
-    cursor.execute("SELECT COUNT(*) FROM users")
-    count = cursor.fetchone()[0]
-    conn.close()
 
-    return count > 0
+async def auser_exists() -> bool:
+    """Async version of user_exists()."""
+    if _any_user_exists:
+        return True
+    return await asyncio.to_thread(user_exists)
@@ -2,22 +2,74 @@
 
 import asyncio
 import base64
-import json
-from typing import Optional, Callable, Awaitable
-from fastapi import WebSocket
-
-from .openai_realtime import RealtimeClient
-from .tts import text_to_speech_stream
+import logging
+import re
+import time
+import orjson
+from typing import Optional, Callable, Awaitable, Tuple
+from fastapi import WebSocket, WebSocketDisconnect
+
+from .openai_realtime import RealtimeClient, realtime_client_pool
+from .tts import text_to_speech_stream, warm_up as warm_up_tts
+from .config import CHAIRMAN_MODEL
 from .council import (
     stage1_collect_responses,
     stage2_collect_rankings,
-    stage3_synthesize_final,
+    stage3_stream_final,
     calculate_aggregate_rankings,
-    generate_conversation_title
+    generate_conversation_title,
+    STAGE3_ERROR_RESPONSE
 )
 from . import storage
 
 
+logger = logging.getLogger(__name__)
+
+# TTS chunks are batched into binary audio frames of about this size, or
+# whatever has arrived after this many seconds, whichever comes first
+_AUDIO_FLUSH_BYTES = 16 * 1024
+_AUDIO_FLUSH_INTERVAL = 0.05
+
+# First byte of binary frames sent to the client; JSON events stay text frames
+_AUDIO_FRAME_TAG = b"\x01"
+
+# Stage 3 text is sent to TTS sentence by sentence while it streams in, in
+# segments of at least this many characters to limit the number of requests
+_TTS_SEGMENT_MIN_CHARS = 80
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+# Payload-free control events, serialized once. Sent as text frames because
+# the client JSON-parses every message.
+_PRECODED_EVENTS = {
+    event_type: orjson.dumps({"type": event_type}).decode("utf-8")
+    for event_type in (
+        "recording_started",
+        "audio_start",
+        "audio_complete",
+        "stage1_start",
+        "stage2_start",
+        "stage3_start",
+    )
+}
+
+
+def _split_tts_segment(text: str) -> Tuple[Optional[str], str]:
+    """Split streamed text into complete sentences ready for TTS and the rest.
+
+    Args:
+        text: Text received so far that has not been sent to TTS
+
+    Returns:
+        Tuple of (segment or None if not long enough yet, remaining text)
+    """
+    last = None
+    for last in _SENTENCE_END.finditer(text):
+        pass
+    if last is None or last.start() < _TTS_SEGMENT_MIN_CHARS:
+        return None, text
+    return text[:last.start()], text[last.end():]
+
+
 class VoiceChatSession:
     """Manages a voice chat session with transcription and TTS."""
 
@@ -32,16 +84,27 @@ class VoiceChatSession:
         self.conversation_id = conversation_id
         self.api_key = api_key
         self.tts_voice = tts_voice
-        self.audio_chunks: list[bytes] = []
         self.realtime_client: Optional[RealtimeClient] = None
         self._is_recording = False
+        # Audio and stage events are sent from concurrent tasks
+        self._send_lock = asyncio.Lock()
 
     async def send_event(self, event_type: str, data: dict = None):
         """Send an event to the client."""
+        if not data:
+            precoded = _PRECODED_EVENTS.get(event_type)
+            if precoded is not None:
+                async with self._send_lock:
+                    await self.websocket.send_text(precoded)
+                return
+
         message = {"type": event_type}
         if data:
             message.update(data)
-        await self.websocket.send_json(message)
+        # orjson is much faster than json.dumps on the large stage payloads
+        text = orjson.dumps(message).decode("utf-8")
+        async with self._send_lock:
+            await self.websocket.send_text(text)
 
     async def handle_message(self, message: dict) -> bool:
         """Handle a message from the client.
@@ -55,14 +118,10 @@ class VoiceChatSession:
             await self._start_recording()
 
         elif msg_type == "audio":
-            # Decode base64 audio and accumulate
+            # Legacy base64 audio; current clients send binary frames
             audio_data = message.get("data", "")
             if audio_data:
-                decoded = base64.b64decode(audio_data)
-                self.audio_chunks.append(decoded)
-                # Stream to realtime API if connected
-                if self.realtime_client:
-                    await self.realtime_client.send_audio(decoded)
+                await self.handle_audio(base64.b64decode(audio_data))
 
         elif msg_type == "stop_recording":
             await self._stop_recording()
@@ -72,168 +131,254 @@ class VoiceChatSession:
 
         return True
 
+    async def handle_audio(self, audio: bytes):
+        """Handle a chunk of raw PCM16 audio from the client."""
+        # Audio is only streamed to the realtime API, never buffered locally
+        if self.realtime_client:
+            await self.realtime_client.send_audio(audio)
+
     async def _start_recording(self):
         """Initialize recording and connect to realtime API."""
-        print("[Voice] Starting recording...")
-        self.audio_chunks = []
+        logger.info("Starting recording")
         self._is_recording = True
 
-        # Connect to OpenAI Realtime API
-        print("[Voice] Connecting to OpenAI Realtime API...")
-        self.realtime_client = RealtimeClient(self.api_key)
-        connected = await self.realtime_client.connect()
+        # Connect to OpenAI Realtime API, reusing a pooled session if possible
+        self._release_realtime_client()
+        logger.debug("Connecting to OpenAI Realtime API")
+        self.realtime_client = await realtime_client_pool.acquire(self.api_key)
 
-        if not connected:
-            print("[Voice] Failed to connect to OpenAI Realtime API")
+        if self.realtime_client is None:
+            logger.warning("Failed to connect to OpenAI Realtime API")
             await self.send_event("error", {"message": "Failed to connect to transcription service"})
             return
 
-        print("[Voice] Connected to OpenAI Realtime API")
+        logger.debug("Connected to OpenAI Realtime API")
         await self.send_event("recording_started")
 
     async def _stop_recording(self):
         """Stop recording and process the audio."""
-        print("[Voice] Stop recording received")
+        logger.info("Stop recording received")
         self._is_recording = False
 
         if not self.realtime_client:
-            print("[Voice] No realtime client active")
+            logger.warning("No realtime client active")
             await self.send_event("error", {"message": "No recording session active"})
             return
 
         try:
             # Commit audio and get transcription
-            print("[Voice] Committing audio to OpenAI...")
+            logger.debug("Committing audio to OpenAI")
             await self.realtime_client.commit_audio()
-            print("[Voice] Waiting for transcription...")
+            logger.debug("Waiting for transcription")
             transcription = await self.realtime_client.receive_messages()
-            try:
-                print(f"[Voice] Transcription received: {transcription}")
-            except UnicodeEncodeError:
-                print(f"[Voice] Transcription received (length: {len(transcription) if transcription else 0})")
+            # The council run takes a while; let the session be reused meanwhile
+            self._release_realtime_client()
+            logger.info("Transcription received (length: %d)", len(transcription) if transcription else 0)
+            logger.debug("Transcription: %r", transcription)
 
             if not transcription or not transcription.strip():
-                print("[Voice] No speech detected")
+                logger.info("No speech detected")
                 await self.send_event("error", {"message": "No speech detected"})
                 return
 
             # Send transcription to client
             await self.send_event("transcription", {"text": transcription})
-            print("[Voice] Starting council process...")
+            logger.info("Starting council process")
 
             # Run council process with transcribed text
             await self._run_council_process(transcription)
 
         except Exception as e:
-            print(f"[Voice] Error in stop_recording: {type(e).__name__}: {e}")
+            logger.exception("Error in stop_recording")
             await self.send_event("error", {"message": str(e)})
         finally:
-            print("[Voice] Closing realtime client")
-            await self.realtime_client.close()
+            self._release_realtime_client()
+
+    def _release_realtime_client(self):
+        """Hand the realtime client back to the pool, if one is held."""
+        if self.realtime_client is not None:
+            logger.debug("Releasing realtime client")
+            realtime_client_pool.release_soon(self.realtime_client)
             self.realtime_client = None
 
     async def _run_council_process(self, user_query: str):
         """Run the 3-stage council process and stream audio response."""
-        # Check conversation exists
-        conversation = storage.get_conversation(self.conversation_id)
-        if not conversation:
+        # Changes are merged into the stored conversation when saved
+        conversation = storage.open_conversation(self.conversation_id)
+        if conversation is None:
             await self.send_event("error", {"message": "Conversation not found"})
             return
 
-        is_first_message = len(conversation["messages"]) == 0
+        title_task = None
+        tts_task = None
+        try:
+            with conversation:
+                is_first_message = len(conversation.messages) == 0
+
+                # Add user message, persisted before the long council run so a
+                # failure can't lose it
+                conversation.add_user_message(user_query)
+                conversation.save()
+
+                # Generate the title in parallel if first message; it's sent as
+                # soon as it is ready rather than after stage 3
+                if is_first_message:
+                    title_task = asyncio.create_task(self._send_title(conversation, user_query))
+
+                # Stage 1
+                await self.send_event("stage1_start")
+                stage1_results = await stage1_collect_responses(user_query)
+                await self.send_event("stage1_complete", {"data": stage1_results})
+
+                # Stage 2
+                await self.send_event("stage2_start")
+                stage2_results, label_to_model = await stage2_collect_rankings(user_query, stage1_results)
+                aggregate_rankings = calculate_aggregate_rankings(stage2_results, label_to_model)
+                await self.send_event("stage2_complete", {
+                    "data": stage2_results,
+                    "metadata": {
+                        "label_to_model": label_to_model,
+                        "aggregate_rankings": aggregate_rankings
+                    }
+                })
+
+                # Stage 3: speak each sentence while the rest is still being generated
+                await self.send_event("stage3_start")
+                segments: asyncio.Queue = asyncio.Queue()
+                tts_task = asyncio.create_task(self._stream_audio_response(segments))
+                parts = []
+                pending = ""
+                failed = False
+                try:
+                    async for delta in stage3_stream_final(user_query, stage1_results, stage2_results):
+                        parts.append(delta)
+                        segment, pending = _split_tts_segment(pending + delta)
+                        if segment:
+                            segments.put_nowait(segment)
+                except Exception:
+                    logger.exception("Chairman stream failed")
+                    failed = True
+
+                response = "".join(parts)
+                if failed or not response:
+                    # Fallback if chairman fails; a truncated answer is not kept
+                    response = pending = STAGE3_ERROR_RESPONSE
+                if pending.strip():
+                    segments.put_nowait(pending)
+                segments.put_nowait(None)
+
+                stage3_result = {"model": CHAIRMAN_MODEL, "response": response}
+                await self.send_event("stage3_complete", {"data": stage3_result})
+
+                # Save assistant message
+                conversation.add_assistant_message(
+                    stage1_results,
+                    stage2_results,
+                    stage3_result
+                )
+
+                if title_task:
+                    await title_task
+
+            # The client closes the socket and reloads on audio_complete, so it
+            # goes last, after the conversation has been saved
+            if await tts_task:
+                await self.send_event("audio_complete")
+        finally:
+            # Don't leave the title or TTS task saving or sending after this
+            # turn ends; nothing awaits between the save on exit and here
+            for task in (title_task, tts_task):
+                if task and not task.done():
+                    task.cancel()
 
-        # Add user message
-        storage.add_user_message(self.conversation_id, user_query)
+    async def _send_title(self, conversation: storage.ConversationHandle, user_query: str):
+        """Generate, save and send the conversation title.
 
-        # Start title generation in parallel if first message
-        title_task = None
-        if is_first_message:
-            title_task = asyncio.create_task(generate_conversation_title(user_query))
-
-        # Stage 1
-        await self.send_event("stage1_start")
-        stage1_results = await stage1_collect_responses(user_query)
-        await self.send_event("stage1_complete", {"data": stage1_results})
-
-        # Stage 2
-        await self.send_event("stage2_start")
-        stage2_results, label_to_model = await stage2_collect_rankings(user_query, stage1_results)
-        aggregate_rankings = calculate_aggregate_rankings(stage2_results, label_to_model)
-        await self.send_event("stage2_complete", {
-            "data": stage2_results,
-            "metadata": {
-                "label_to_model": label_to_model,
-                "aggregate_rankings": aggregate_rankings
-            }
-        })
-
-        # Stage 3
-        await self.send_event("stage3_start")
-        stage3_result = await stage3_synthesize_final(user_query, stage1_results, stage2_results)
-        await self.send_event("stage3_complete", {"data": stage3_result})
-
-        # Save assistant message
-        storage.add_assistant_message(
-            self.conversation_id,
-            stage1_results,
-            stage2_results,
-            stage3_result
-        )
-
-        # Handle title
-        if title_task:
-            title = await title_task
-            storage.update_conversation_title(self.conversation_id, title)
-            await self.send_event("title_complete", {"data": {"title": title}})
-
-        # Convert stage 3 response to speech
-        await self._stream_audio_response(stage3_result.get("response", ""))
-
-    async def _stream_audio_response(self, text: str):
-        """Stream TTS audio response to client."""
-        if not text:
-            await self.send_event("audio_complete")
-            return
+        The title is saved right away so the sidebar shows it when the client
+        reloads on title_complete, well before the council run finishes.
+        """
+        title = await generate_conversation_title(user_query)
+        conversation.set_title(title)
+        conversation.save()
+        await self.send_event("title_complete", {"data": {"title": title}})
 
+    async def _stream_audio_response(self, segments: "asyncio.Queue[Optional[str]]") -> bool:
+        """Stream TTS audio for text segments to the client.
+
+        Args:
+            segments: Queue of text segments to speak, ended by None
+
+        Returns:
+            True if all audio was sent, False if TTS failed
+        """
         try:
             await self.send_event("audio_start")
 
-            async for chunk in text_to_speech_stream(
-                self.api_key,
-                text,
-                voice=self.tts_voice,
-                model="tts-1",
-                response_format="mp3"
-            ):
-                # Send audio chunk as base64
-                audio_base64 = base64.b64encode(chunk).decode("utf-8")
-                await self.send_event("audio_response", {"data": audio_base64})
-
-            await self.send_event("audio_complete")
+            # Open the TTS connection while the first sentence is generated
+            await warm_up_tts()
+
+            while (text := await segments.get()) is not None:
+                buffer = bytearray()
+                last_flush = time.monotonic()
+                async for chunk in text_to_speech_stream(
+                    self.api_key,
+                    text,
+                    voice=self.tts_voice,
+                    model="tts-1",
+                    response_format="mp3"
+                ):
+                    buffer += chunk
+                    now = time.monotonic()
+                    if len(buffer) >= _AUDIO_FLUSH_BYTES or now - last_flush >= _AUDIO_FLUSH_INTERVAL:
+                        await self._send_audio(buffer)
+                        buffer.clear()
+                        last_flush = now
+
+                if buffer:
+                    await self._send_audio(buffer)
+
+            return True
 
         except Exception as e:
             await self.send_event("error", {"message": f"TTS error: {str(e)}"})
+            return False
+
+    async def _send_audio(self, audio: bytes):
+        """Send a batch of audio to the client as a tagged binary frame."""
+        frame = _AUDIO_FRAME_TAG + audio
+        async with self._send_lock:
+            await self.websocket.send_bytes(frame)
 
     async def run(self):
         """Main session loop."""
         try:
             while True:
                 try:
-                    data = await self.websocket.receive_json()
-                    print(f"[Voice] Received message: {data.get('type', 'unknown')}")
+                    message = await self.websocket.receive()
+                    if message["type"] == "websocket.disconnect":
+                        raise WebSocketDisconnect(message.get("code", 1000))
+
+                    # Binary frames carry raw PCM16 audio, text frames JSON
+                    audio = message.get("bytes")
+                    if audio is not None:
+                        await self.handle_audio(audio)
+                        continue
+
+                    data = orjson.loads(message["text"])
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Received message: %s", data.get("type", "unknown"))
                     should_continue = await self.handle_message(data)
                     if not should_continue:
                         break
                 except Exception as e:
-                    print(f"[Voice] Error in message loop: {type(e).__name__}: {e}")
+                    logger.debug("Error in message loop: %s: %s", type(e).__name__, e)
                     raise
         except Exception as e:
-            print(f"[Voice] Session error: {type(e).__name__}: {e}")
+            logger.warning("Session error: %s: %s", type(e).__name__, e)
             try:
                 await self.send_event("error", {"message": str(e)})
             except:
                 pass
         finally:
-            print("[Voice] Session ending, cleaning up")
-            if self.realtime_client:
-                await self.realtime_client.close()
+            logger.info("Session ending, cleaning up")
+            self._release_realtime_client()
@@ -88,7 +88,10 @@ function App() {
           console.warn('[App] Last message is not an assistant message');
           return prev;
         }
-        updater(lastMsg);
+        // Update a copy so the updater stays pure (StrictMode runs it twice)
+        const msg = { ...lastMsg, loading: { ...lastMsg.loading } };
+        updater(msg);
+        messages[messages.length - 1] = msg;
         return { ...prev, messages };
       });
     };
@@ -100,6 +103,12 @@ function App() {
         });
         break;
 
+      case 'stage1_partial':
+        updateLastAssistantMessage((msg) => {
+          msg.stage1 = [...(msg.stage1 || []), data];
+        });
+        break;
+
       case 'stage1_complete':
         updateLastAssistantMessage((msg) => {
           msg.stage1 = data;
@@ -110,6 +119,15 @@ function App() {
       case 'stage2_start':
         updateLastAssistantMessage((msg) => {
           msg.loading.stage2 = true;
+          if (metadata) {
+            msg.metadata = { ...msg.metadata, ...metadata };
+          }
+        });
+        break;
+
+      case 'stage2_partial':
+        updateLastAssistantMessage((msg) => {
+          msg.stage2 = [...(msg.stage2 || []), data];
         });
         break;
 
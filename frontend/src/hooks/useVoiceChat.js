@@ -1,6 +1,8 @@
 import { useState, useRef, useCallback, useEffect } from 'react';
 import { api } from '../api';
 
+const AUDIO_FRAME_TAG = 0x01;
+
 export default function useVoiceChat(conversationId, onStageUpdate) {
   const [isRecording, setIsRecording] = useState(false);
   const [isProcessing, setIsProcessing] = useState(false);
@@ -61,6 +63,7 @@ export default function useVoiceChat(conversationId, onStageUpdate) {
       }
 
       const ws = new WebSocket(api.getVoiceWebSocketUrl(conversationId));
+      ws.binaryType = 'arraybuffer';
 
       ws.onopen = () => {
         console.log('[VoiceChat] WebSocket connected');
@@ -94,6 +97,14 @@ export default function useVoiceChat(conversationId, onStageUpdate) {
       };
 
       ws.onmessage = (event) => {
+        // Binary frames are TTS audio, tagged with a leading 0x01 byte
+        if (event.data instanceof ArrayBuffer) {
+          if (new Uint8Array(event.data, 0, 1)[0] === AUDIO_FRAME_TAG) {
+            audioChunksRef.current.push(new Uint8Array(event.data, 1));
+          }
+          return;
+        }
+
         try {
           const message = JSON.parse(event.data);
           handleMessage(message);
@@ -165,12 +176,6 @@ export default function useVoiceChat(conversationId, onStageUpdate) {
         audioChunksRef.current = [];
         break;
 
-      case 'audio_response':
-        if (data) {
-          audioChunksRef.current.push(base64ToArrayBuffer(data));
-        }
-        break;
-
       case 'audio_complete':
         console.log('[VoiceChat] Audio complete, playing response');
         playAudioResponse();
@@ -218,15 +223,6 @@ export default function useVoiceChat(conversationId, onStageUpdate) {
     }
   };
 
-  const base64ToArrayBuffer = (base64) => {
-    const binaryString = atob(base64);
-    const bytes = new Uint8Array(binaryString.length);
-    for (let i = 0; i < binaryString.length; i++) {
-      bytes[i] = binaryString.charCodeAt(i);
-    }
-    return bytes.buffer;
-  };
-
   const startRecording = async () => {
     console.log('[VoiceChat] Starting recording...');
     setError(null);
@@ -255,12 +251,9 @@ export default function useVoiceChat(conversationId, onStageUpdate) {
 
         const inputData = e.inputBuffer.getChannelData(0);
         const pcm16 = float32ToPcm16(inputData);
-        const base64 = arrayBufferToBase64(pcm16.buffer);
 
-        wsRef.current.send(JSON.stringify({
-          type: 'audio',
-          data: base64
-        }));
+        // Send raw PCM16 as a binary frame
+        wsRef.current.send(pcm16.buffer);
       };
 
       source.connect(processor);
@@ -309,15 +302,6 @@ export default function useVoiceChat(conversationId, onStageUpdate) {
     return pcm16;
   };
 
-  const arrayBufferToBase64 = (buffer) => {
-    const bytes = new Uint8Array(buffer);
-    let binary = '';
-    for (let i = 0; i < bytes.byteLength; i++) {
-      binary += String.fromCharCode(bytes[i]);
-    }
-    return btoa(binary);
-  };
-
   return {
     isRecording,
     isProcessing,
@@ -0,0 +1,121 @@
+"""Tests for the HS256 JWT signer and verifier in backend.auth."""
+
+import base64
+import hmac
+import json
+import time
+import unittest
+
+from backend import auth
+
+
+def _encode(data: dict) -> str:
+    """Serialize a dict as an unpadded base64url JWT segment."""
+    raw = json.dumps(data, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).rstrip(b'=').decode('ascii')
+
+
+def _sign(payload: dict, header: dict = None) -> str:
+    """Build a token signed with the app secret, with any header and payload."""
+    header = header or {"alg": "HS256", "typ": "JWT"}
+    signing_input = f"{_encode(header)}.{_encode(payload)}"
+    signature = hmac.digest(auth._JWT_SECRET_BYTES, signing_input.encode('ascii'), 'sha256')
+    return f"{signing_input}.{base64.urlsafe_b64encode(signature).rstrip(b'=').decode('ascii')}"
+
+
+def _payload(**claims) -> dict:
+    """A payload that verifies unless the given claims override it."""
+    payload = {"sub": "user-1", "exp": int(time.time()) + 60}
+    payload.update(claims)
+    return payload
+
+
+class TokenRoundTripTest(unittest.TestCase):
+    def test_create_then_verify(self):
+        token = auth.create_token("user-1", "a@example.com", is_admin=True)
+        payload = auth.verify_token(token)
+        self.assertIsNotNone(payload)
+        self.assertEqual(payload["sub"], "user-1")
+        self.assertEqual(payload["email"], "a@example.com")
+        self.assertIs(payload["is_admin"], True)
+        self.assertGreater(payload["exp"], time.time())
+
+    def test_hand_signed_token_verifies(self):
+        self.assertIsNotNone(auth.verify_token(_sign(_payload())))
+
+
+class TokenTamperingTest(unittest.TestCase):
+    def setUp(self):
+        self.token = auth.create_token("user-1", "a@example.com")
+        self.header, self.payload, self.signature = self.token.split('.')
+
+    def test_tampered_signature(self):
+        flipped = 'A' if self.signature[0] != 'A' else 'B'
+        token = f"{self.header}.{self.payload}.{flipped}{self.signature[1:]}"
+        self.assertIsNone(auth.verify_token(token))
+
+    def test_tampered_payload(self):
+        forged = _encode(_payload(sub="user-2", is_admin=True))
+        self.assertIsNone(auth.verify_token(f"{self.header}.{forged}.{self.signature}"))
+
+    def test_junk_appended_to_token(self):
+        self.assertIsNone(auth.verify_token(self.token + "!!"))
+
+    def test_junk_inside_segments(self):
+        for index in range(3):
+            parts = self.token.split('.')
+            # Four characters keep the padding arithmetic unchanged
+            parts[index] = parts[index][:4] + "!!!!" + parts[index][4:]
+            with self.subTest(segment=index):
+                self.assertIsNone(auth.verify_token('.'.join(parts)))
+
+    def test_wrong_segment_count(self):
+        self.assertIsNone(auth.verify_token(f"{self.header}.{self.payload}"))
+        self.assertIsNone(auth.verify_token(self.token + ".extra"))
+
+    def test_non_ascii_input(self):
+        self.assertIsNone(auth.verify_token(self.token + "é"))
+        self.assertIsNone(auth.verify_token(f"{self.header}.{self.payload}é.{self.signature}"))
+        self.assertIsNone(auth.verify_token("ü.ö.ä"))
+
+
+class TokenAlgorithmTest(unittest.TestCase):
+    def test_other_algorithm_rejected(self):
+        token = _sign(_payload(), header={"alg": "HS512", "typ": "JWT"})
+        self.assertIsNone(auth.verify_token(token))
+
+    def test_alg_none_rejected(self):
+        token = f"{_encode({'alg': 'none', 'typ': 'JWT'})}.{_encode(_payload())}."
+        self.assertIsNone(auth.verify_token(token))
+
+    def test_missing_alg_rejected(self):
+        self.assertIsNone(auth.verify_token(_sign(_payload(), header={"typ": "JWT"})))
+
+
+class TokenClaimsTest(unittest.TestCase):
+    def test_expired(self):
+        self.assertIsNone(auth.verify_token(_sign(_payload(exp=int(time.time()) - 1))))
+
+    def test_future_nbf(self):
+        self.assertIsNone(auth.verify_token(_sign(_payload(nbf=int(time.time()) + 60))))
+
+    def test_past_nbf(self):
+        self.assertIsNotNone(auth.verify_token(_sign(_payload(nbf=int(time.time()) - 60))))
+
+    def test_missing_exp(self):
+        self.assertIsNone(auth.verify_token(_sign({"sub": "user-1"})))
+
+    def test_non_numeric_exp(self):
+        for exp in ("9999999999", None, True, [1], {"t": 1}):
+            with self.subTest(exp=exp):
+                self.assertIsNone(auth.verify_token(_sign(_payload(exp=exp))))
+
+    def test_non_numeric_nbf(self):
+        self.assertIsNone(auth.verify_token(_sign(_payload(nbf="0"))))
+
+    def test_payload_not_an_object(self):
+        self.assertIsNone(auth.verify_token(_sign(["sub", "user-1"])))
+
+
+if __name__ == "__main__":
+    unittest.main()